@@ -68,9 +68,7 @@ class Bot:
 
     async def chat(self, messages: Messages) -> str:
         system_message: Message = {"role": "system", "content": self.system_content()}
-        all_messages: Messages = []
-        all_messages.append(system_message)
-        all_messages.extend(messages)
+        all_messages: Messages = (system_message, *messages)
 
         return await self.chat_completion(all_messages)
 
@@ -31,8 +31,9 @@ class LLMClient:
                 max_tokens=max_tokens,
                 stream=False,
             )
-            if response.choices and response.choices[0].message.content:
-                content = response.choices[0].message.content
+            choices = response.choices
+            if choices:
+                content = choices[0].message.content or ""
         except Exception as e:
             logger.error("Error communicating with LLM: %s", e)
             content = f"Error communicating with LLM: {e}"
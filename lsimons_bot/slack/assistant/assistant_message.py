@@ -61,7 +61,6 @@ def assistant_message_handler_maker(
 
 
 async def read_thread(client: AsyncWebClient, channel_id: str, thread_ts: str) -> Messages:
-    messages: Messages = []
     replies: AsyncSlackResponse = await client.conversations_replies(
         channel=channel_id,
         ts=thread_ts,
@@ -69,13 +68,12 @@ async def read_thread(client: AsyncWebClient, channel_id: str, thread_ts: str) -
         limit=100,
     )
     raw_messages = cast(list[dict[str, Any]], replies.get("messages", []))
-    for message in raw_messages:
-        message_text = cast(str, message.get("text", ""))
-        if message_text.strip() == "":
-            continue
-        bot_id = message.get("bot_id")
-        if bot_id is None:
-            messages.append({"role": "user", "content": message_text})
-        else:
-            messages.append({"role": "assistant", "content": message_text})
-    return messages
+    return [
+        (
+            {"role": "user", "content": message_text}
+            if message.get("bot_id") is None
+            else {"role": "assistant", "content": message_text}
+        )
+        for message in raw_messages
+        if (message_text := cast(str, message.get("text", ""))).strip()
+    ]
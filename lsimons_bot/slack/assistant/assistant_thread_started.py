@@ -7,17 +7,17 @@ from slack_bolt.async_app import (
 
 logger = logging.getLogger(__name__)
 
+SUGGESTED_PROMPTS = [
+    "Who is Leo?",
+    "Where is Leo?",
+    "Why is Leo?",
+]
+
 
 async def assistant_thread_started(say: AsyncSay, set_suggested_prompts: AsyncSetSuggestedPrompts) -> None:
     logger.debug(">> assistant_thread_started()")
 
     _ = await say(":wave: Hi, how can I help you today?")
-    _ = await set_suggested_prompts(
-        prompts=[
-            "Who is Leo?",
-            "Where is Leo?",
-            "Why is Leo?",
-        ]
-    )
+    _ = await set_suggested_prompts(prompts=SUGGESTED_PROMPTS)
 
     logger.debug("<< assistant_thread_started()")
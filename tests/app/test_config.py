@@ -1,46 +1,41 @@
-import os
-from unittest.mock import patch
-
 import pytest
 
-from lsimons_bot.app.config import get_env_vars, validate_env_vars
+from lsimons_bot.app.config import REQUIRED_VARS, get_env_vars, validate_env_vars
 
 
 class TestValidateEnvVars:
-    def test_all_variables_present(self) -> None:
-        with patch.dict(os.environ, {"VAR1": "value1", "VAR2": "value2"}, clear=True):
-            result = validate_env_vars(["VAR1", "VAR2"])
-            assert result == {"VAR1": "value1", "VAR2": "value2"}
-
-    def test_missing_variables(self) -> None:
-        with patch.dict(os.environ, {}, clear=True):
-            with pytest.raises(match="Missing required environment variables"):
-                validate_env_vars(["VAR1", "VAR2"])
+    def test_all_variables_present(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("VAR1", "value1")
+        monkeypatch.setenv("VAR2", "value2")
+
+        result = validate_env_vars(["VAR1", "VAR2"])
+        assert result == {"VAR1": "value1", "VAR2": "value2"}
+
+    @pytest.mark.parametrize(
+        "env,missing",
+        [
+            pytest.param({}, "VAR1, VAR2", id="none"),
+            pytest.param({"VAR1": "value1"}, "VAR2", id="partial"),
+            pytest.param({"VAR1": "", "VAR2": ""}, "VAR1, VAR2", id="empty"),
+        ],
+    )
+    def test_missing_variables(self, monkeypatch: pytest.MonkeyPatch, env: dict[str, str], missing: str) -> None:
+        monkeypatch.delenv("VAR1", raising=False)
+        monkeypatch.delenv("VAR2", raising=False)
+        for name, value in env.items():
+            monkeypatch.setenv(name, value)
+
+        with pytest.raises(Exception, match=f"Missing required environment variables: {missing}$"):
+            validate_env_vars(["VAR1", "VAR2"])
 
 
 class TestGetEnvVars:
-    def test_all_env_vars_present(self) -> None:
-        with patch.dict(
-            os.environ,
-            {
-                "SLACK_BOT_TOKEN": "xoxb-test",
-                "SLACK_APP_TOKEN": "xapp-test",
-                "LITELLM_API_BASE": "http://localhost:8000",
-                "LITELLM_API_KEY": "test-key",
-                "ASSISTANT_MODEL": "test/gpt-5-mini",
-            },
-            clear=True,
-        ):
-            result = get_env_vars()
-            assert result == {
-                "SLACK_BOT_TOKEN": "xoxb-test",
-                "SLACK_APP_TOKEN": "xapp-test",
-                "LITELLM_API_BASE": "http://localhost:8000",
-                "LITELLM_API_KEY": "test-key",
-                "ASSISTANT_MODEL": "test/gpt-5-mini",
-            }
-
-    def test_missing_env_vars(self) -> None:
-        with patch.dict(os.environ, {}, clear=True):
-            with pytest.raises(match="Missing required environment variables"):
-                get_env_vars()
+    def test_all_env_vars_present(self, env_vars: dict[str, str]) -> None:
+        assert get_env_vars() == env_vars
+
+    @pytest.mark.parametrize("missing", REQUIRED_VARS)
+    def test_missing_env_var(self, monkeypatch: pytest.MonkeyPatch, env_vars: dict[str, str], missing: str) -> None:
+        monkeypatch.delenv(missing)
+
+        with pytest.raises(Exception, match=f"Missing required environment variables: {missing}$"):
+            get_env_vars()
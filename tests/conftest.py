@@ -0,0 +1,16 @@
+import pytest
+
+ENV_VARS = {
+    "SLACK_BOT_TOKEN": "xoxb-test",
+    "SLACK_APP_TOKEN": "xapp-test",
+    "LITELLM_API_BASE": "http://localhost:8000",
+    "LITELLM_API_KEY": "test-key",
+    "ASSISTANT_MODEL": "test/gpt-5-mini",
+}
+
+
+@pytest.fixture
+def env_vars(monkeypatch: pytest.MonkeyPatch) -> dict[str, str]:
+    for name, value in ENV_VARS.items():
+        monkeypatch.setenv(name, value)
+    return dict(ENV_VARS)
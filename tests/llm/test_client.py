@@ -1,30 +1,38 @@
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
 
 import pytest
 
 from lsimons_bot.llm.client import LLMClient
 
 
+def _response(*contents: str | None) -> SimpleNamespace:
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content)) for content in contents])
+
+
 class TestLLMClient:
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def client(self) -> LLMClient:
         return LLMClient(base_url="http://localhost:8000", api_key="test-key", model="gpt-4")
 
-    @pytest.mark.asyncio
-    async def test_chat_completion(self, client: LLMClient) -> None:
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = "Test response"
-
-        with patch.object(client.client.chat.completions, "create", new=AsyncMock(return_value=mock_response)):
-            result = await client.chat_completion([{"role": "user", "content": "Hello"}])
-            assert result == "Test response"
-
-    @pytest.mark.asyncio
-    async def test_chat_completion_empty_response(self, client: LLMClient) -> None:
-        mock_response = MagicMock()
-        mock_response.choices = []
-
-        with patch.object(client.client.chat.completions, "create", new=AsyncMock(return_value=mock_response)):
-            result = await client.chat_completion([{"role": "user", "content": "Hello"}])
-            assert result == ""
+    @pytest.mark.parametrize(
+        "response,expected",
+        [
+            pytest.param(_response("Test response"), "Test response", id="content"),
+            pytest.param(_response(), "", id="no-choices"),
+            pytest.param(_response(None), "", id="no-content"),
+        ],
+    )
+    async def test_chat_completion(
+        self, client: LLMClient, monkeypatch: pytest.MonkeyPatch, response: SimpleNamespace, expected: str
+    ) -> None:
+        monkeypatch.setattr(client.client.chat.completions, "create", AsyncMock(return_value=response))
+
+        result = await client.chat_completion([{"role": "user", "content": "Hello"}])
+        assert result == expected
+
+    async def test_chat_completion_error(self, client: LLMClient, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(client.client.chat.completions, "create", AsyncMock(side_effect=ValueError("Unexpected")))
+
+        result = await client.chat_completion([{"role": "user", "content": "Hello"}])
+        assert result == "Error communicating with LLM: Unexpected"
@@ -1,4 +1,5 @@
-from unittest.mock import AsyncMock, MagicMock, patch
+from typing import NamedTuple
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -7,21 +8,34 @@ from lsimons_bot.slack.assistant.assistant_message import (
     read_thread,
 )
 
+THREAD_TS = "1234567890.123456"
+THREAD_REPLIES = {
+    "messages": [
+        {"text": "user message"},
+        {"text": "  "},
+        {"text": "bot response", "bot_id": "B123"},
+    ]
+}
+
+
+class Callbacks(NamedTuple):
+    say: AsyncMock
+    set_status: AsyncMock
+    set_title: AsyncMock
+
+
+@pytest.fixture
+def client() -> MagicMock:
+    client = MagicMock()
+    client.conversations_replies = AsyncMock()
+    return client
+
 
 class TestReadThread:
-    @pytest.mark.asyncio
-    async def test_read_thread_happy_path(self) -> None:
-        mock_client = MagicMock()
-        mock_response = {
-            "messages": [
-                {"text": "user message"},
-                {"text": "  "},
-                {"text": "bot response", "bot_id": "B123"},
-            ]
-        }
-        mock_client.conversations_replies = AsyncMock(return_value=mock_response)
-
-        messages = await read_thread(mock_client, "C123", "1234567890.123456")
+    async def test_read_thread_happy_path(self, client: MagicMock) -> None:
+        client.conversations_replies.return_value = THREAD_REPLIES
+
+        messages = await read_thread(client, "C123", THREAD_TS)
 
         assert len(messages) == 2
         assert messages[0]["role"] == "user"
@@ -29,7 +43,17 @@ class TestReadThread:
 
 
 class TestAssistantMessage:
-    async def _call_assistant_message(self, channel_id: str | None, thread_ts: str | None, mock_client: MagicMock) -> None:
+    @pytest.fixture
+    def callbacks(self) -> Callbacks:
+        return Callbacks(say=AsyncMock(), set_status=AsyncMock(), set_title=AsyncMock())
+
+    @pytest.fixture(autouse=True)
+    def no_sleep(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr("lsimons_bot.slack.assistant.assistant_message.sleep", AsyncMock())
+
+    async def _call_assistant_message(
+        self, channel_id: str | None, thread_ts: str | None, mock_client: MagicMock, callbacks: Callbacks
+    ) -> None:
         mock_context = MagicMock()
         mock_context.channel_id = channel_id
         mock_context.thread_ts = thread_ts
@@ -40,30 +64,41 @@ class TestAssistantMessage:
 
         assistant_message = assistant_message_handler_maker(mock_bot)
 
-        with patch("lsimons_bot.slack.assistant.assistant_message.sleep", new=AsyncMock()):
-            await assistant_message(
-                mock_context,
-                {"text": "hello"},
-                AsyncMock(),
-                AsyncMock(),
-                AsyncMock(),
-                mock_client,
-            )
-
-    @pytest.mark.asyncio
-    async def test_assistant_message_happy_path(self) -> None:
-        await self._call_assistant_message(None, None, MagicMock())
-
-    @pytest.mark.asyncio
-    async def test_assistant_message_with_thread(self) -> None:
-        mock_client = MagicMock()
-        mock_client.conversations_replies = AsyncMock(return_value={"messages": [{"text": "hello"}]})
-
-        await self._call_assistant_message("C123", "1234567890.123456", mock_client)
-
-    @pytest.mark.asyncio
-    async def test_assistant_message_error_handling(self) -> None:
-        mock_client = MagicMock()
-        mock_client.conversations_replies = AsyncMock(side_effect=Exception("API error"))
-
-        await self._call_assistant_message("C123", "1234567890.123456", mock_client)
+        await assistant_message(
+            context=mock_context,
+            payload={"text": "hello"},
+            say=callbacks.say,
+            set_status=callbacks.set_status,
+            set_title=callbacks.set_title,
+            client=mock_client,
+        )
+
+    @pytest.mark.parametrize(
+        "channel_id,thread_ts",
+        [
+            pytest.param(None, None, id="no-context"),
+            pytest.param("C123", None, id="no-thread"),
+            pytest.param(None, THREAD_TS, id="no-channel"),
+        ],
+    )
+    async def test_assistant_message_without_thread(
+        self, channel_id: str | None, thread_ts: str | None, client: MagicMock, callbacks: Callbacks
+    ) -> None:
+        await self._call_assistant_message(channel_id, thread_ts, client, callbacks)
+
+        client.conversations_replies.assert_not_called()
+        callbacks.say.assert_awaited_once_with("Bot response")
+
+    async def test_assistant_message_with_thread(self, client: MagicMock, callbacks: Callbacks) -> None:
+        client.conversations_replies.return_value = THREAD_REPLIES
+
+        await self._call_assistant_message("C123", THREAD_TS, client, callbacks)
+
+        callbacks.say.assert_awaited_once_with("Bot response")
+
+    async def test_assistant_message_error_handling(self, client: MagicMock, callbacks: Callbacks) -> None:
+        client.conversations_replies.side_effect = Exception("API error")
+
+        await self._call_assistant_message("C123", THREAD_TS, client, callbacks)
+
+        callbacks.say.assert_awaited_once_with("Error reading the message thread: API error")
@@ -1,30 +1,36 @@
-from unittest.mock import MagicMock, patch
+from unittest.mock import Mock
 
+import pytest
+
+import lsimons_bot.slack.assistant as assistant_module
 from lsimons_bot.slack.assistant import register
 
 
 class TestRegister:
-    def test_register_happy_path(self) -> None:
-        mock_app = MagicMock()
-        mock_bot = MagicMock()
+    @pytest.fixture
+    def mock_assistant(self, monkeypatch: pytest.MonkeyPatch) -> Mock:
+        mock_assistant = Mock()
+        monkeypatch.setattr(assistant_module, "AsyncAssistant", Mock(return_value=mock_assistant))
+        return mock_assistant
 
-        with patch("lsimons_bot.slack.assistant.AsyncAssistant") as mock_assistant_class:
-            mock_assistant = MagicMock()
-            mock_assistant_class.return_value = mock_assistant
+    @pytest.fixture
+    def mock_factory(self, monkeypatch: pytest.MonkeyPatch) -> Mock:
+        mock_factory = Mock()
+        monkeypatch.setattr(assistant_module, "assistant_message_handler_maker", mock_factory)
+        return mock_factory
 
-            with patch("lsimons_bot.slack.assistant.assistant_message_handler_maker") as mock_factory:
-                mock_handler = MagicMock()
-                mock_factory.return_value = mock_handler
+    def test_register_happy_path(self, mock_assistant: Mock, mock_factory: Mock) -> None:
+        mock_app = Mock()
+        mock_bot = Mock()
 
-                with patch("lsimons_bot.slack.assistant.assistant_thread_started") as mock_thread_started:
-                    register(mock_app, mock_bot)
+        register(mock_app, mock_bot)
 
-                    # Verify the factory was called with the bot instance
-                    mock_factory.assert_called_once_with(mock_bot)
+        # Verify the factory was called with the bot instance
+        mock_factory.assert_called_once_with(mock_bot)
 
-                    # Verify assistant methods were called properly
-                    mock_assistant.thread_started.assert_called_once_with(mock_thread_started)
-                    mock_assistant.user_message.assert_called_once_with(mock_handler)
+        # Verify assistant methods were called properly
+        mock_assistant.thread_started.assert_called_once_with(assistant_module.assistant_thread_started)
+        mock_assistant.user_message.assert_called_once_with(mock_factory.return_value)
 
-                    # Verify the assistant was registered with the app
-                    mock_app.use.assert_called_once_with(mock_assistant)
+        # Verify the assistant was registered with the app
+        mock_app.use.assert_called_once_with(mock_assistant)
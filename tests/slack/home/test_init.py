@@ -1,12 +1,12 @@
-from unittest.mock import MagicMock
+from unittest.mock import Mock
 
 from lsimons_bot.slack.home import register
 
 
 class TestRegister:
     def test_register_happy_path(self) -> None:
-        mock_app = MagicMock()
-        mock_event = MagicMock()
+        mock_app = Mock()
+        mock_event = Mock()
         mock_app.event.return_value = mock_event
 
         register(mock_app)
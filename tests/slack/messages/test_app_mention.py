@@ -1,10 +1,7 @@
-import pytest
-
 from lsimons_bot.slack.messages.app_mention import app_mention
 
 
 class TestAppMention:
-    @pytest.mark.asyncio
     async def test_app_mention_runs_without_error(self) -> None:
         body = {
             "event": {
@@ -1,8 +1,8 @@
-from unittest.mock import MagicMock
+from unittest.mock import Mock
 
 from lsimons_bot.slack.messages import register
 
 
 class TestRegister:
     def test_register_happy_path(self) -> None:
-        register(MagicMock())
+        register(Mock())
@@ -1,13 +1,17 @@
+from typing import Any
+
 import pytest
 
 from lsimons_bot.slack.messages.message import message
 
 
 class TestMessage:
-    @pytest.mark.asyncio
-    async def test_message_happy_path(self) -> None:
-        await message({"event": {"text": "hello"}})
-
-    @pytest.mark.asyncio
-    async def test_message_ignores_bot_messages(self) -> None:
-        await message({"event": {"text": "hello", "bot_id": "B123"}})
+    @pytest.mark.parametrize(
+        "event",
+        [
+            pytest.param({"text": "hello"}, id="user"),
+            pytest.param({"text": "hello", "bot_id": "B123"}, id="bot"),
+        ],
+    )
+    async def test_message(self, event: dict[str, Any]) -> None:
+        await message({"event": event})